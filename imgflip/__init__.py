@@ -1,16 +1,25 @@
 import aiohttp
 import requests
-from typing import Union, TypeVar, List, Dict, Optional, Literal
+from typing import (
+    Union, TypeVar, List, Optional, Literal, Iterator, AsyncIterator
+)
 from .objects import *
 from .models import *
-from .errors import ImgflipError
+from .errors import ImgflipError, CircuitOpenError
+from .hedging import Hedger
+from .breaker import CircuitBreaker
 
 __all__ = (
     "Imgflip",
     "ImgflipError",
+    "CircuitOpenError",
     "Meme",
     "Box",
-    "Template"
+    "Template",
+    "TemplateList",
+    "TemplateDict",
+    "Hedger",
+    "CircuitBreaker"
 )
 
 __version__ = "1.0"
@@ -32,6 +41,11 @@ class Imgflip():
         the session which will be used by the class. 
         If it is ``requests.Session``, the methods of this would be sync 
         and if ``aiohttp.ClientSession``, the methods would be async.
+    hedger: Optional[:class:`~imgflip.Hedger`]
+        if passed, image downloads will be hedged with it to cut tail latency.
+    breaker: Optional[:class:`~imgflip.CircuitBreaker`]
+        if passed, requests will fail fast with
+        :exc:`~imgflip.CircuitOpenError` while imgflip is unavailable.
 
     Raises
     ------
@@ -42,15 +56,17 @@ class Imgflip():
         self,
         username: str,
         password: str,
-        session: Optional[SessionObject] = None
+        session: Optional[SessionObject] = None,
+        hedger: Optional[Hedger] = None,
+        breaker: Optional[CircuitBreaker] = None
     ):
         if session is None:
             session: requests.sessions.Session = requests.Session()
         if isinstance(session, requests.sessions.Session):
-            self._model: ImgflipModel = SyncModel(session)
+            self._model: ImgflipModel = SyncModel(session, hedger, breaker)
 
         elif isinstance(session, aiohttp.client.ClientSession):
-            self._model: ImgflipModel = AsyncModel(session)
+            self._model: ImgflipModel = AsyncModel(session, hedger, breaker)
 
         else:
             raise TypeError(
@@ -61,12 +77,14 @@ class Imgflip():
 
         self.username: str = username
         self.password: str = password
+        self.hedger: Optional[Hedger] = hedger
+        self.breaker: Optional[CircuitBreaker] = breaker
 
     def popular_memes(
         self,
         limit: Optional[int] = 100,
         dictionary: Optional[bool] = True
-    ) -> Union[List[Template], Dict[str, Template]]:
+    ) -> Union[TemplateList, TemplateDict]:
         """| This function is a |coro|_ if the session is ``aiohttp.ClientSession``
         | Get the most popular meme templates from imgflip based on 
           how many times they get captioned.
@@ -77,21 +95,80 @@ class Imgflip():
             the amount of templates you want. Defaults to ``100``. 
             You can only get upto ``100`` popular meme templates.
         dictionary: :class:`bool`
-            If ``True``, it will return a :class:`dict` with 
+            If ``True``, it will return a :class:`~imgflip.TemplateDict` with 
             template names as keys and :class:`~imgflip.Template` objects as values
 
-            If ``False``, it will return a :class:`list` of 
+            If ``False``, it will return a :class:`~imgflip.TemplateList` of 
             :class:`~imgflip.Template` objects.
         
         Returns
         -------
-        Union[List[:class:`~imgflip.Template`], Dict[str, :class:`~imgflip.Template`]]
+        Union[:class:`~imgflip.TemplateList`, :class:`~imgflip.TemplateDict`]
             the popular meme templates
+
+        Raises
+        ------
+        ValueError
+            the limit is negative.
+
+        .. note::
+            earlier versions returned a plain :class:`list` or :class:`dict`.
+            The returned views are read-only, use ``list(templates)``,
+            ``dict(templates)`` or ``templates.copy()`` to get a mutable copy.
         """
+        if limit < 0:
+            raise ValueError(f"Expected a non-negative limit, got {limit} instead.")
         if limit > 100:
             limit = 100
         return self._model.get_memes(limit, dictionary)
 
+    def iter_popular_memes(
+        self,
+        limit: Optional[int] = 100
+    ) -> Union[Iterator[Template], AsyncIterator[Template]]:
+        """| This function returns an async iterator 
+          if the session is ``aiohttp.ClientSession``
+        | Same as :meth:`~imgflip.Imgflip.popular_memes`, but yields 
+          the templates one by one while the response is being read.
+
+        Parameters
+        ----------
+        limit: Optional[:class:`int`]
+            the amount of templates you want. Defaults to ``100``. 
+            You can only get upto ``100`` popular meme templates.
+
+        Raises
+        ------
+        ValueError
+            the limit is negative.
+
+        Yields
+        ------
+        :class:`~imgflip.Template`
+            the popular meme templates
+        """
+        if limit < 0:
+            raise ValueError(f"Expected a non-negative limit, got {limit} instead.")
+        if limit > 100:
+            limit = 100
+        return self._model.iter_memes(limit)
+
+    def read_template(self, template: Template) -> bytes:
+        """| This function is a |coro|_ if the session is ``aiohttp.ClientSession``
+        | Reads the image of a meme template and get its bytes.
+
+        Parameters
+        ----------
+        template: :class:`~imgflip.Template`
+            the template whose image should be read
+
+        Returns
+        -------
+        :class:`bytes`
+            the image of the template in bytes
+        """
+        return self._model.read_image(template.url)
+
     def make_meme(
         self,
         template: Union[int, Template],
@@ -126,6 +203,13 @@ class Imgflip():
         
         Raises
         ------
+        TypeError
+            the font isn't impact or arial, or an argument has the wrong type.
+        ValueError
+            a text, box or template is invalid, or more texts or boxes
+            are given than the ``box_count`` of the template.
+        :exc:`~imgflip.CircuitOpenError`
+            the circuit breaker is open.
         :exc:`~imgflip.ImgflipError`
             Something went wrong while making the meme.
         
@@ -146,6 +230,46 @@ class Imgflip():
             top_text = None
             bottom_text = None
 
+        if (not isinstance(max_font_size, int)
+            or isinstance(max_font_size, bool)
+            or max_font_size <= 0):
+            raise ValueError(
+                f"Expected a positive max font size, got {max_font_size!r} instead."
+            )
+
+        for text in (top_text, bottom_text):
+            if text is None:
+                continue
+            if not isinstance(text, str):
+                raise TypeError(
+                    f"Expected str for the text, got {text.__class__.__name__} instead."
+                )
+            if not text.strip():
+                raise ValueError("Text must not be empty.")
+
+        if boxes is not None:
+            for box in boxes:
+                if not isinstance(box, Box):
+                    raise TypeError(
+                        f"Expected Box, got {box.__class__.__name__} instead."
+                    )
+                box._validate()
+
+        if not any((top_text, bottom_text, boxes)):
+            raise ValueError("No text provided.")
+
+        if boxes is not None:
+            box_count = len(boxes)
+        elif bottom_text is not None:
+            box_count = 2
+        else:
+            box_count = 1
+
+        if isinstance(template, Template):
+            template._validate(box_count)
+        elif int(template) <= 0:
+            raise ValueError(f"Invalid template id {template}.")
+
         return self._model.caption_image(
             username = self.username,
             password = self.password,
@@ -1,6 +1,6 @@
 import argparse
 from difflib import get_close_matches as match
-from . import Imgflip, Box
+from . import Imgflip, Box, ImgflipError
 
 def error(*msg):
     print(*msg)
@@ -174,14 +174,17 @@ else:
         boxes = None
         if args.boxes is not None:
             boxes = [list_to_box(box) for box in args.boxes]
-        meme = client.make_meme(
-            template_id, 
-            font, 
-            max_font_size, 
-            args.top_text, 
-            args.bottom_text, 
-            boxes
-        )
+        try:
+            meme = client.make_meme(
+                template_id, 
+                font, 
+                max_font_size, 
+                args.top_text, 
+                args.bottom_text, 
+                boxes
+            )
+        except (TypeError, ValueError, ImgflipError) as e:
+            error(e)
         print(
             f"""meme created!
             You can find it at: {meme.page_url}
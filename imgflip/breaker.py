@@ -0,0 +1,142 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .errors import ImgflipError, CircuitOpenError
+
+__all__ = ("CircuitBreaker",)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+def _is_outage(exc: Exception) -> bool:
+    # aiohttp.ClientResponseError has the status,
+    # requests.HTTPError has the response
+    status = getattr(exc, "status", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if not isinstance(status, int):
+        return True
+    return status >= 500 or status == 429
+
+
+class CircuitBreaker():
+    """| Fails fast while imgflip is unreachable instead of waiting
+      out the full timeout of every request.
+    | After ``failure_threshold`` consecutive failures the breaker opens and
+      every request raises :exc:`~imgflip.CircuitOpenError` without being sent.
+      Once ``reset_timeout`` seconds have passed, a single probe request is let
+      through (half-open). If it succeeds the breaker closes again,
+      otherwise it opens for another ``reset_timeout`` seconds.
+
+    Pass an instance to the ``breaker`` parameter of :class:`~imgflip.Imgflip`
+    to use it.
+
+    .. note::
+        an :exc:`~imgflip.ImgflipError` returned by imgflip or an http error
+        status below 500 (other than 429) means that imgflip answered,
+        so it does not count as a failure.
+
+    Parameters
+    ----------
+    failure_threshold: Optional[:class:`int`]
+        the number of consecutive failures that open the breaker.
+        Defaults to ``5``.
+    reset_timeout: Optional[:class:`float`]
+        the number of seconds to stay open before probing. Defaults to ``30``.
+
+    Attributes
+    ----------
+    failures: :class:`int`
+        the number of consecutive failures
+    """
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = 5,
+        reset_timeout: Optional[float] = 30.0
+    ):
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.failures: int = 0
+
+        self._opened_at: Optional[float] = None
+        self._probing: bool = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """:class:`str`: ``"closed"``, ``"open"`` or ``"half-open"``"""
+        with self._lock:
+            return self._state()
+
+    @property
+    def retry_after(self) -> float:
+        """:class:`float`: the seconds left until the breaker probes again.
+        ``0`` if it isn't open."""
+        with self._lock:
+            if self._state() != OPEN:
+                return 0.0
+            return self._retry_after()
+
+    def _retry_after(self) -> float:
+        return max(self._opened_at + self.reset_timeout - time.monotonic(), 0.0)
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if (self._probing
+            or time.monotonic() - self._opened_at < self.reset_timeout):
+            return OPEN
+        return HALF_OPEN
+
+    def reset(self) -> None:
+        """Closes the breaker and clears the failure count."""
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            state = self._state()
+            if state == OPEN:
+                raise CircuitOpenError(
+                    "imgflip is unavailable, not sending the request. Retry in "
+                    f"{self._retry_after():.1f}s."
+                )
+            self._probing = state == HALF_OPEN
+            return self._probing
+
+    def _release(self, probe: bool, ok: Optional[bool]) -> None:
+        with self._lock:
+            if probe:
+                self._probing = False
+
+            if ok is True:
+                self.failures = 0
+                self._opened_at = None
+
+            elif ok is False:
+                self.failures += 1
+                if probe or self.failures >= self.failure_threshold:
+                    self._opened_at = time.monotonic()
+
+    @contextmanager
+    def _guard(self) -> Iterator[None]:
+        probe = self._acquire()
+        try:
+            yield
+        except ImgflipError:
+            self._release(probe, True)
+            raise
+        except Exception as e:
+            self._release(probe, not _is_outage(e))
+            raise
+        except BaseException:
+            self._release(probe, None)
+            raise
+        else:
+            self._release(probe, True)
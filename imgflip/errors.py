@@ -1,3 +1,9 @@
 class ImgflipError(Exception):
     """The exception that is raised when making the meme fails."""
+    pass
+
+
+class CircuitOpenError(ImgflipError):
+    """The exception that is raised when a request isn't sent
+    because the :class:`~imgflip.CircuitBreaker` is open."""
     pass
\ No newline at end of file
@@ -0,0 +1,348 @@
+import time
+import asyncio
+import threading
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import (
+    Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple, TypeVar
+)
+
+__all__ = ("Hedger",)
+
+T = TypeVar("T")
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Hedger():
+    """| Hedges image downloads to cut tail latency.
+    | If the first request has not answered within a delay taken from
+      a percentile of recent latencies, a second request is sent.
+      The first response to arrive is used and the other one is cancelled.
+    | To avoid doubling the load when imgflip is slow as a whole, only
+      ``max_hedge_rate`` of recent fetches may be hedged and at most
+      ``max_pending_hedges`` extra requests may be running at once.
+
+    Pass an instance to the ``hedger`` parameter of :class:`~imgflip.Imgflip`
+    to hedge :meth:`~imgflip.SyncMeme.read`, :meth:`~imgflip.AsyncMeme.read`
+    and :meth:`~imgflip.Imgflip.read_template`.
+
+    Parameters
+    ----------
+    percentile: Optional[:class:`float`]
+        the percentile of recent latencies to wait for before hedging.
+        Defaults to ``95``.
+    initial_delay: Optional[:class:`float`]
+        the delay in seconds used until ``min_samples`` latencies
+        have been recorded. Defaults to ``0.5``.
+    min_samples: Optional[:class:`int`]
+        the number of latencies needed before the percentile is used.
+        Defaults to ``20``.
+    window: Optional[:class:`int`]
+        the number of recent fetches to remember. Defaults to ``200``.
+    buckets: Optional[Sequence[:class:`float`]]
+        the upper bounds in seconds of the latency histogram buckets.
+    max_workers: Optional[:class:`int`]
+        the number of threads used to hedge sync requests. Defaults to ``8``.
+        Sync reads made while all of them are busy aren't hedged.
+    max_hedge_rate: Optional[:class:`float`]
+        the highest fraction of recent fetches that may be hedged.
+        Defaults to ``0.1``.
+    max_pending_hedges: Optional[:class:`int`]
+        the highest number of hedged fetches whose losing request
+        is still running. Defaults to ``2``.
+
+    Attributes
+    ----------
+    requests: :class:`int`
+        the number of fetches that have been made through the hedger,
+        including failed ones
+    hedged: :class:`int`
+        the number of fetches for which a second request was sent
+    hedge_wins: :class:`int`
+        the number of fetches that were answered by the second request
+    """
+    def __init__(
+        self,
+        percentile: Optional[float] = 95,
+        initial_delay: Optional[float] = 0.5,
+        min_samples: Optional[int] = 20,
+        window: Optional[int] = 200,
+        buckets: Optional[Sequence[float]] = DEFAULT_BUCKETS,
+        max_workers: Optional[int] = 8,
+        max_hedge_rate: Optional[float] = 0.1,
+        max_pending_hedges: Optional[int] = 2
+    ):
+        if not 0 < percentile <= 100:
+            raise ValueError(
+                f"Expected percentile between 0 and 100, got {percentile} instead."
+            )
+
+        self.percentile: float = percentile
+        self.initial_delay: float = initial_delay
+        self.min_samples: int = min_samples
+        self.max_hedge_rate: float = max_hedge_rate
+        self.max_pending_hedges: int = max_pending_hedges
+        self.requests: int = 0
+        self.hedged: int = 0
+        self.hedge_wins: int = 0
+
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._recent_hedges: Deque[bool] = deque(maxlen=window)
+        self._pending_hedges: int = 0
+        self._busy: int = 0
+        self._buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._lock = threading.Lock()
+        self._max_workers: int = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def delay(self) -> float:
+        """:class:`float`: the current delay in seconds before hedging"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            latencies = sorted(self._latencies)
+        index = round(self.percentile / 100 * (len(latencies) - 1))
+        return latencies[index]
+
+    @property
+    def hedge_rate(self) -> float:
+        """:class:`float`: the fraction of fetches that were hedged"""
+        if self.requests == 0:
+            return 0.0
+        return self.hedged / self.requests
+
+    @property
+    def pending_hedges(self) -> int:
+        """:class:`int`: the number of hedged fetches whose losing request
+        is still running"""
+        return self._pending_hedges
+
+    def histogram(self) -> Dict[float, int]:
+        """Gets the latency histogram of all the successful fetches,
+        measured from the call until the caller got the response.
+
+        Returns
+        -------
+        Dict[:class:`float`, :class:`int`]
+            the bucket upper bounds in seconds mapped to the number of fetches
+            that finished within them. The last key is ``float("inf")``.
+        """
+        with self._lock:
+            counts = list(self._counts)
+        return dict(zip(self._buckets + (float("inf"),), counts))
+
+    def _record(
+        self,
+        hedged: bool,
+        hedge_won: bool,
+        waited: Optional[float] = None,
+        primary_latency: Optional[float] = None
+    ) -> None:
+        # waited is what the caller saw and goes into the histogram.
+        # primary_latency feeds the delay: the running time of the first
+        # request, or a lower bound of it when the hedge answered first.
+        # Both are None when the fetch failed.
+        with self._lock:
+            self.requests += 1
+            self.hedged += hedged
+            self.hedge_wins += hedge_won
+            self._recent_hedges.append(hedged)
+            if primary_latency is not None:
+                self._latencies.append(primary_latency)
+            if waited is not None:
+                self._counts[bisect_left(self._buckets, waited)] += 1
+
+    @staticmethod
+    def _latency(times: List[float]) -> Optional[float]:
+        if not times:
+            return None
+        end = times[1] if len(times) > 1 else time.perf_counter()
+        return end - times[0]
+
+    def _submit(
+        self,
+        func: Callable[[], T]
+    ) -> Optional[Tuple["Future[T]", List[float]]]:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers)
+            if self._busy >= self._max_workers:
+                return None
+            self._busy += 1
+            executor = self._executor
+
+        times: List[float] = []
+
+        def call():
+            times.append(time.perf_counter())
+            try:
+                return func()
+            finally:
+                times.append(time.perf_counter())
+
+        future = executor.submit(call)
+        future.add_done_callback(self._worker_done)
+        return future, times
+
+    def _worker_done(self, _) -> None:
+        with self._lock:
+            self._busy -= 1
+
+    def _acquire_hedge(self) -> bool:
+        with self._lock:
+            if self._pending_hedges >= self.max_pending_hedges:
+                return False
+            recent = self._recent_hedges
+            if recent and sum(recent) / len(recent) >= self.max_hedge_rate:
+                return False
+            self._pending_hedges += 1
+            return True
+
+    def _release_hedge(self, *_) -> None:
+        with self._lock:
+            self._pending_hedges -= 1
+
+    def run(self, func: Callable[[], T]) -> T:
+        """Calls ``func`` in a worker thread and hedges it with a second call
+        if it takes longer than :attr:`delay`.
+        If all the ``max_workers`` threads are busy, ``func`` is called
+        directly without hedging.
+
+        .. note::
+            a call that has already started in a thread can't be interrupted,
+            its result is discarded instead and it keeps its worker thread
+            until it finishes.
+
+        .. warning::
+            the calls share the ``requests.Session`` of the meme across
+            worker threads. requests does not document sessions as
+            thread-safe, so only hedge sessions that aren't mutated
+            while reading (no changing headers, cookies or adapters).
+        """
+        start = time.perf_counter()
+        submitted = self._submit(func)
+        if submitted is None:
+            try:
+                result = func()
+            except Exception:
+                self._record(False, False)
+                raise
+            elapsed = time.perf_counter() - start
+            self._record(False, False, elapsed, elapsed)
+            return result
+
+        primary, primary_times = submitted
+        hedge = None
+        done, _ = wait((primary,), timeout=self.delay)
+        if not done and self._acquire_hedge():
+            submitted = self._submit(func)
+            if submitted is None:
+                self._release_hedge()
+            else:
+                hedge = submitted[0]
+
+        if hedge is None:
+            try:
+                result = primary.result()
+            except Exception:
+                self._record(False, False)
+                raise
+            self._record(
+                False,
+                False,
+                time.perf_counter() - start,
+                self._latency(primary_times)
+            )
+            return result
+
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    self._record(
+                        True,
+                        future is hedge,
+                        time.perf_counter() - start,
+                        self._latency(primary_times)
+                    )
+                    loser = hedge if future is primary else primary
+                    loser.cancel()
+                    loser.add_done_callback(self._release_hedge)
+                    return future.result()
+            if not pending:
+                self._release_hedge()
+                self._record(True, False)
+                return primary.result()
+
+    async def arun(self, func: Callable[[], Awaitable[T]]) -> T:
+        """| This function is a |coro|_
+        | Awaits ``func()`` and hedges it with a second call
+          if it takes longer than :attr:`delay`.
+        """
+        primary_times: List[float] = []
+
+        async def call():
+            primary_times.append(time.perf_counter())
+            try:
+                return await func()
+            finally:
+                primary_times.append(time.perf_counter())
+
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(call())
+        pending = {primary}
+        hedged = False
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.delay)
+            if not done and self._acquire_hedge():
+                hedged = True
+            else:
+                try:
+                    result = await primary
+                except Exception:
+                    self._record(False, False)
+                    raise
+                self._record(
+                    False,
+                    False,
+                    time.perf_counter() - start,
+                    self._latency(primary_times)
+                )
+                return result
+
+            hedge = asyncio.ensure_future(func())
+            pending = {primary, hedge}
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self._record(
+                            True,
+                            task is hedge,
+                            time.perf_counter() - start,
+                            self._latency(primary_times)
+                        )
+                        return task.result()
+                if not pending:
+                    self._record(True, False)
+                    return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if hedged:
+                self._release_hedge()
+
+    def close(self) -> None:
+        """Shuts down the worker threads used for sync requests."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
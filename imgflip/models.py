@@ -1,21 +1,132 @@
+import re
+import json
+import codecs
+from itertools import chain
+from contextlib import nullcontext
 from .objects import *
 from .errors import ImgflipError
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 BASE_URL = "https://api.imgflip.com"
+CHUNK_SIZE = 8192
+
+MEMES_START = re.compile(r'"memes"\s*:\s*\[')
+SEPARATOR = re.compile(r"[\s,]*")
+
+
+class MemeParser():
+    """Incrementally parses the templates out of a ``/get_memes`` response."""
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._done = False
+
+    def feed(self, chunk):
+        self._buffer += self._decoder.decode(chunk)
+        memes = []
+
+        if not self._started:
+            match = MEMES_START.search(self._buffer)
+            if match is None:
+                return memes
+            self._started = True
+            self._buffer = self._buffer[match.end():]
+
+        pos = 0
+        while not self._done:
+            pos = SEPARATOR.match(self._buffer, pos).end()
+            if pos == len(self._buffer):
+                break
+            if self._buffer[pos] == "]":
+                self._done = True
+                break
+            try:
+                meme, pos = self._json.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError:
+                break
+            memes.append(meme)
+
+        self._buffer = self._buffer[pos:]
+        return memes
+
+    def close(self):
+        if self._done:
+            return
+        if not self._started:
+            try:
+                resp_json = loads(self._buffer)
+            except ValueError:
+                resp_json = None
+            if (isinstance(resp_json, dict)
+                and resp_json.get("success") is False):
+                raise ImgflipError(resp_json["error_message"])
+        raise ValueError("Unexpected response from /get_memes.")
 
 
 class SyncModel():
-    def __init__(self, session):
+    def __init__(self, session, hedger=None, breaker=None):
         self.session = session
+        self.hedger = hedger
+        self.breaker = breaker
+
+    def _guard(self):
+        if self.breaker is None:
+            return nullcontext()
+        return self.breaker._guard()
 
     def get_memes(self, limit, dictionary):
-        resp = self.session.get(f"{BASE_URL}/get_memes")
-        memes = resp.json()["data"]["memes"][:limit]
+        with self._guard():
+            resp = self.session.get(f"{BASE_URL}/get_memes")
+            memes = loads(resp.content)["data"]["memes"][:limit]
 
         if dictionary is False:
-            return [Template(**meme) for meme in memes]
+            return TemplateList(memes)
+
+        return TemplateDict(memes)
+
+    def iter_memes(self, limit):
+        if limit <= 0:
+            return
+        # the breaker only covers reaching imgflip, it must not stay
+        # acquired while the caller holds the generator between templates
+        with self._guard():
+            resp = self.session.get(f"{BASE_URL}/get_memes", stream=True)
+            try:
+                resp.raise_for_status()
+                chunks = resp.iter_content(CHUNK_SIZE)
+                first = next(chunks, b"")
+            except BaseException:
+                resp.close()
+                raise
+
+        try:
+            parser = MemeParser()
+            for chunk in chain((first,), chunks):
+                for meme in parser.feed(chunk):
+                    yield Template(**meme)
+                    limit -= 1
+                    if limit == 0:
+                        return
+            parser.close()
+        finally:
+            resp.close()
+
+    def read_image(self, url):
+        def fetch():
+            resp = self.session.get(url)
+            resp.raise_for_status()
+            return resp.content
 
-        return {meme["name"]: Template(**meme) for meme in memes}
+        with self._guard():
+            if self.hedger is None:
+                return fetch()
+            return self.hedger.run(fetch)
 
     def caption_image(self, **kwargs):
         kwargs["template_id"] = int(kwargs["template_id"])
@@ -30,15 +141,17 @@ class SyncModel():
 
             for index, box in enumerate(data.get("boxes")):
                 for k, v in box._raw.items():
-                    boxes[f"boxes[{index}][{k}]"] = v
+                    if v is not None:
+                        boxes[f"boxes[{index}][{k}]"] = v
 
             del data["boxes"]
             data.update(boxes)
 
         data["max_font_size"] = f"{data['max_font_size']}px"
 
-        resp = self.session.post(f"{BASE_URL}/caption_image", params=data)
-        resp_json = resp.json()
+        with self._guard():
+            resp = self.session.post(f"{BASE_URL}/caption_image", params=data)
+            resp_json = resp.json()
 
         if resp_json["success"] is False:
             raise ImgflipError(resp_json["error_message"])
@@ -46,23 +159,78 @@ class SyncModel():
         meme = SyncMeme(
             template_id=kwargs["template_id"],
             session=self.session,
+            hedger=self.hedger,
+            breaker=self.breaker,
             **(resp_json["data"])
         )
         return meme
 
 
 class AsyncModel():
-    def __init__(self, session):
+    def __init__(self, session, hedger=None, breaker=None):
         self.session = session
+        self.hedger = hedger
+        self.breaker = breaker
+
+    def _guard(self):
+        if self.breaker is None:
+            return nullcontext()
+        return self.breaker._guard()
 
     async def get_memes(self, limit, dictionary):
-        async with self.session.get(f"{BASE_URL}/get_memes") as resp:
-            memes = (await resp.json())["data"]["memes"][:limit]
+        with self._guard():
+            async with self.session.get(f"{BASE_URL}/get_memes") as resp:
+                memes = loads(await resp.read())["data"]["memes"][:limit]
 
         if dictionary is False:
-            return [Template(**meme) for meme in memes]
+            return TemplateList(memes)
+
+        return TemplateDict(memes)
+
+    async def iter_memes(self, limit):
+        if limit <= 0:
+            return
+        # the breaker only covers reaching imgflip, it must not stay
+        # acquired while the caller holds the generator between templates
+        with self._guard():
+            resp = await self.session.get(f"{BASE_URL}/get_memes")
+            try:
+                resp.raise_for_status()
+                chunks = resp.content.iter_chunked(CHUNK_SIZE)
+                first = await chunks.__anext__()
+            except StopAsyncIteration:
+                first = b""
+            except BaseException:
+                resp.release()
+                raise
+
+        async def all_chunks():
+            yield first
+            async for chunk in chunks:
+                yield chunk
 
-        return {meme["name"]: Template(**meme) for meme in memes}
+        try:
+            parser = MemeParser()
+            async for chunk in all_chunks():
+                for meme in parser.feed(chunk):
+                    yield Template(**meme)
+                    limit -= 1
+                    if limit == 0:
+                        return
+            parser.close()
+        finally:
+            resp.release()
+
+    async def read_image(self, url):
+        async def fetch():
+            async with self.session.get(url) as resp:
+                resp.raise_for_status()
+                return await resp.read()
+
+        with self._guard():
+            if self.hedger is None:
+                return await fetch()
+            return await self.hedger.arun(fetch)
 
     async def caption_image(self, **kwargs):
         kwargs["template_id"] = int(kwargs["template_id"])
@@ -77,23 +245,28 @@ class AsyncModel():
 
             for index, box in enumerate(data.get("boxes")):
                 for k, v in box._raw.items():
-                    boxes[f"boxes[{index}][{k}]"] = v
+                    if v is not None:
+                        boxes[f"boxes[{index}][{k}]"] = v
 
             del data["boxes"]
             data.update(boxes)
 
         data["max_font_size"] = f"{data['max_font_size']}px"
 
-        async with self.session.post(
-            f"{BASE_URL}/caption_image", params=data
-        ) as resp:
-            resp_json = await resp.json()
-            if resp_json["success"] is False:
-                raise ImgflipError(resp_json["error_message"])
+        with self._guard():
+            async with self.session.post(
+                f"{BASE_URL}/caption_image", params=data
+            ) as resp:
+                resp_json = await resp.json()
 
-            meme = AsyncMeme(
-                template_id=kwargs["template_id"],
-                session=self.session,
-                **(resp_json["data"])
-            )
+        if resp_json["success"] is False:
+            raise ImgflipError(resp_json["error_message"])
+
+        meme = AsyncMeme(
+            template_id=kwargs["template_id"],
+            session=self.session,
+            hedger=self.hedger,
+            breaker=self.breaker,
+            **(resp_json["data"])
+        )
         return meme
\ No newline at end of file
@@ -1,9 +1,18 @@
-from typing import TYPE_CHECKING, Union, Tuple, Dict, Optional
+import re
+from contextlib import nullcontext
+from typing import (
+    TYPE_CHECKING, Any, Union, Tuple, Dict, Optional, List, Iterator,
+    Mapping, Sequence, overload
+)
 
 if TYPE_CHECKING:
     from . import SessionObject
+    from .hedging import Hedger
+    from .breaker import CircuitBreaker
     from os import PathLike
 
+HEX_COLOR = re.compile(r"#(?:[0-9a-fA-F]{3}){1,2}")
+
 
 class Meme():
     """| Base class for :class:`~imgflip.SyncMeme` and :class:`~imgflip.AsyncMeme`
@@ -23,17 +32,26 @@ class Meme():
         template_id: int,
         url: str,
         page_url: str,
-        session: "SessionObject"
+        session: "SessionObject",
+        hedger: Optional["Hedger"] = None,
+        breaker: Optional["CircuitBreaker"] = None
     ):
         self.template_id: int = int(template_id)
         self.url: str = url
         self.page_url: str = page_url
         self.session: SessionObject = session
+        self._hedger: Optional[Hedger] = hedger
+        self._breaker: Optional[CircuitBreaker] = breaker
 
     def __str__(self) -> str:
         """gets the url of the meme"""
         return self.url
 
+    def _guard(self):
+        if self._breaker is None:
+            return nullcontext()
+        return self._breaker._guard()
+
 
 class SyncMeme(Meme):
     """This is a subclass of :class:`~imgflip.Meme`. 
@@ -48,8 +66,15 @@ class SyncMeme(Meme):
         :class:`bytes`
             the image of the meme in bytes
         """
-        resp = self.session.get(self.url)
-        return resp.content
+        def fetch():
+            resp = self.session.get(self.url)
+            resp.raise_for_status()
+            return resp.content
+
+        with self._guard():
+            if self._hedger is None:
+                return fetch()
+            return self._hedger.run(fetch)
 
     def save(self, fp: "PathLike") -> None:
         """Saves the meme image in a file. This returns nothing.
@@ -78,9 +103,15 @@ class AsyncMeme(Meme):
         :class:`bytes`
             the image of the meme in bytes
         """
-        async with self.session.get(self.url) as resp:
-            img = await resp.read()
-        return img
+        async def fetch():
+            async with self.session.get(self.url) as resp:
+                resp.raise_for_status()
+                return await resp.read()
+
+        with self._guard():
+            if self._hedger is None:
+                return await fetch()
+            return await self._hedger.arun(fetch)
 
     async def save(self, fp: "PathLike") -> None:
         """| This function is a |coro|_
@@ -146,11 +177,46 @@ class Box():
         """gets the text of the box"""
         return self.text
 
+    def _validate(self) -> None:
+        if not isinstance(self.text, str):
+            raise TypeError(
+                f"Expected str for the box text, got {self.text.__class__.__name__} instead."
+            )
+        if not self.text.strip():
+            raise ValueError("Box text must not be empty.")
+
+        for name, pair, minimum in (
+            ("position", self.position, 0),
+            ("size", self.size, 1)
+        ):
+            if (not isinstance(pair, (tuple, list))
+                or len(pair) != 2
+                or not all(isinstance(v, int) for v in pair)):
+                raise TypeError(
+                    f"Expected a tuple of two ints for the box {name}, got {pair!r} instead."
+                )
+            if min(pair) < minimum:
+                raise ValueError(
+                    f"Box {name} must be at least {minimum}, got {pair!r} instead."
+                )
+
+        for name, color in (
+            ("color", self.color),
+            ("outline color", self.outline_color)
+        ):
+            if color is None:
+                continue
+            if not isinstance(color, str) or HEX_COLOR.fullmatch(color) is None:
+                raise ValueError(
+                    f"Expected a hex color like #ffffff for the box {name}, got {color!r} instead."
+                )
+
 class Template():
     """| Represents a meme template which can be passed into 
       :meth:`~imgflip.Imgflip.make_meme`.
     | ``int(template_obj)`` will return the id of the template.
     | ``str(template_obj)`` will return the name of the template.
+    | Templates with the same id are equal.
     
     Attributes
     ----------
@@ -189,4 +255,102 @@ class Template():
 
     def __int__(self) -> int:
         """get the template id"""
-        return self.id
\ No newline at end of file
+        return self.id
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Template):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def _validate(self, box_count: int = 0) -> None:
+        if self.id <= 0:
+            raise ValueError(f"Invalid template id {self.id}.")
+
+        if self.box_count is not None and box_count > self.box_count:
+            raise ValueError(
+                f"Template {self} has only {self.box_count} boxes, got {box_count} instead."
+            )
+
+
+class TemplateList(Sequence[Template]):
+    """| A read-only list of :class:`~imgflip.Template` objects returned in
+      :meth:`~imgflip.Imgflip.popular_memes`.
+    | Each template is only created the first time it is accessed.
+    """
+    def __init__(self, raw: List[Dict[str, Any]]):
+        self._raw: List[Dict[str, Any]] = raw
+        self._cache: List[Optional[Template]] = [None] * len(raw)
+
+    @overload
+    def __getitem__(self, index: int) -> Template: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Template]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        template = self._cache[index]
+        if template is None:
+            template = self._cache[index] = Template(**self._raw[index])
+        return template
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, TemplateList):
+            other = list(other)
+        if not isinstance(other, list):
+            return NotImplemented
+        return list(self) == other
+
+    def __repr__(self) -> str:
+        return f"<TemplateList len={len(self)}>"
+
+    def copy(self) -> List[Template]:
+        """Gets the templates as a new :class:`list`."""
+        return list(self)
+
+
+class TemplateDict(Mapping[str, Template]):
+    """| A read-only dict of template names to :class:`~imgflip.Template`
+      objects returned in :meth:`~imgflip.Imgflip.popular_memes`.
+    | Each template is only created the first time it is accessed.
+    """
+    def __init__(self, raw: List[Dict[str, Any]]):
+        self._templates: TemplateList = TemplateList(raw)
+        self._index: Optional[Dict[str, int]] = None
+
+    def _get_index(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = {
+                meme["name"]: index
+                for index, meme in enumerate(self._templates._raw)
+            }
+        return self._index
+
+    def __getitem__(self, name: str) -> Template:
+        return self._templates[self._get_index()[name]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_index())
+
+    def __len__(self) -> int:
+        return len(self._get_index())
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self) == dict(other)
+
+    def __repr__(self) -> str:
+        return f"<TemplateDict len={len(self)}>"
+
+    def copy(self) -> Dict[str, Template]:
+        """Gets the templates as a new :class:`dict`."""
+        return dict(self)
@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from imgflip import CircuitBreaker, CircuitOpenError, ImgflipError
+
+
+class StatusError(Exception):
+    def __init__(self, status):
+        self.status = status
+
+
+def call(breaker, exc=None):
+    with breaker._guard():
+        if exc is not None:
+            raise exc
+
+
+def fail(breaker, exc=None):
+    with pytest.raises(type(exc) if exc else ConnectionError):
+        call(breaker, exc or ConnectionError("down"))
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    fail(breaker)
+    assert breaker.state == "closed"
+    fail(breaker)
+    assert breaker.state == "open"
+    assert 0 < breaker.retry_after <= 60
+
+    with pytest.raises(CircuitOpenError):
+        call(breaker)
+
+
+def test_success_resets_failures():
+    breaker = CircuitBreaker(failure_threshold=2)
+    fail(breaker)
+    call(breaker)
+    fail(breaker)
+    assert breaker.state == "closed"
+    assert breaker.failures == 1
+
+
+def test_half_open_probe_closes():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    fail(breaker)
+    time.sleep(0.06)
+    assert breaker.state == "half-open"
+
+    with breaker._guard():
+        # only one probe at a time
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            call(breaker)
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+def test_half_open_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.05)
+    for _ in range(3):
+        fail(breaker)
+    time.sleep(0.06)
+    fail(breaker)
+    assert breaker.state == "open"
+    assert breaker.retry_after > 0
+
+
+def test_cancelled_probe_stays_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    fail(breaker)
+    time.sleep(0.06)
+    with pytest.raises(KeyboardInterrupt):
+        call(breaker, KeyboardInterrupt())
+    assert breaker.state == "half-open"
+
+
+@pytest.mark.parametrize("exc, opens", [
+    (ImgflipError("No texts specified."), False),
+    (StatusError(404), False),
+    (StatusError(429), True),
+    (StatusError(503), True),
+])
+def test_what_counts_as_failure(exc, opens):
+    breaker = CircuitBreaker(failure_threshold=1)
+    with pytest.raises(type(exc)):
+        call(breaker, exc)
+    assert (breaker.state == "open") is opens
+
+
+def test_reset():
+    breaker = CircuitBreaker(failure_threshold=1)
+    fail(breaker)
+    breaker.reset()
+    assert breaker.state == "closed"
+    assert breaker.retry_after == 0
@@ -0,0 +1,136 @@
+import time
+import asyncio
+import threading
+
+import pytest
+
+from imgflip import Hedger
+
+
+def make_hedger(**kwargs):
+    kwargs.setdefault("initial_delay", 0.05)
+    kwargs.setdefault("max_hedge_rate", 1.0)
+    return Hedger(**kwargs)
+
+
+def slow_then_fast(slow=0.5, fast=0.01):
+    """A function whose first call is slow and the following ones fast."""
+    calls = []
+    lock = threading.Lock()
+
+    def func():
+        with lock:
+            calls.append(None)
+            number = len(calls)
+        time.sleep(slow if number == 1 else fast)
+        return number
+
+    return func, calls
+
+
+def test_fast_primary_is_not_hedged():
+    hedger = make_hedger()
+    assert hedger.run(lambda: "img") == "img"
+    assert (hedger.requests, hedger.hedged, hedger.hedge_wins) == (1, 0, 0)
+    hedger.close()
+
+
+def test_hedge_wins_records_caller_wait():
+    hedger = make_hedger()
+    func, calls = slow_then_fast()
+    assert hedger.run(func) == 2
+    assert (hedger.requests, hedger.hedged, hedger.hedge_wins) == (1, 1, 1)
+
+    histogram = hedger.histogram()
+    assert histogram[0.05] == 0
+    assert histogram[0.1] == 1
+    # the slow primary was given up on after at least the initial delay
+    assert hedger._latencies[0] >= 0.05
+    time.sleep(0.5)
+    assert hedger.pending_hedges == 0
+    hedger.close()
+
+
+def test_both_failing_raises_and_is_recorded():
+    hedger = make_hedger()
+
+    def func():
+        time.sleep(0.1)
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        hedger.run(func)
+    assert (hedger.requests, hedger.hedged, hedger.hedge_wins) == (1, 1, 0)
+    assert sum(hedger.histogram().values()) == 0
+    assert hedger.pending_hedges == 0
+    hedger.close()
+
+
+def test_failed_hedge_falls_back_to_primary():
+    hedger = make_hedger()
+    calls = []
+
+    def func():
+        calls.append(None)
+        if len(calls) == 1:
+            time.sleep(0.2)
+            return "img"
+        raise ConnectionError("502")
+
+    assert hedger.run(func) == "img"
+    assert (hedger.hedged, hedger.hedge_wins) == (1, 0)
+    hedger.close()
+
+
+def test_hedge_rate_is_capped():
+    hedger = make_hedger(max_hedge_rate=0.5)
+    for _ in range(2):
+        func, _ = slow_then_fast(slow=0.2)
+        hedger.run(func)
+    assert (hedger.requests, hedger.hedged) == (2, 1)
+    hedger.close()
+
+
+def test_full_pool_runs_directly():
+    hedger = make_hedger(max_workers=1, initial_delay=10)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait()
+
+    thread = threading.Thread(target=hedger.run, args=(blocking,))
+    thread.start()
+    started.wait()
+    assert hedger.run(threading.get_ident) == threading.get_ident()
+    release.set()
+    thread.join()
+    hedger.close()
+
+
+def test_async_hedge_wins():
+    hedger = make_hedger()
+    calls = []
+
+    async def func():
+        calls.append(None)
+        await asyncio.sleep(0.5 if len(calls) == 1 else 0.01)
+        return len(calls)
+
+    assert asyncio.run(hedger.arun(func)) == 2
+    assert (hedger.requests, hedger.hedged, hedger.hedge_wins) == (1, 1, 1)
+    assert hedger.pending_hedges == 0
+
+
+def test_async_both_failing_raises():
+    hedger = make_hedger()
+
+    async def func():
+        await asyncio.sleep(0.1)
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(hedger.arun(func))
+    assert (hedger.requests, hedger.hedged) == (1, 1)
+    assert hedger.pending_hedges == 0
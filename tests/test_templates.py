@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from imgflip import ImgflipError, Template, TemplateDict, TemplateList
+from imgflip.models import MemeParser
+
+MEMES = [
+    {
+        "id": str(index),
+        "name": f"Mème {index} 🐸",
+        "url": f"https://i.imgflip.com/{index}.jpg",
+        "width": 500,
+        "height": 400,
+        "box_count": 2
+    }
+    for index in range(5)
+]
+BODY = json.dumps(
+    {"success": True, "data": {"memes": MEMES}},
+    ensure_ascii=False,
+    indent=1
+).encode()
+
+
+def parse(chunks):
+    parser = MemeParser()
+    memes = []
+    for chunk in chunks:
+        memes.extend(parser.feed(chunk))
+    parser.close()
+    return memes
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(BODY)])
+def test_parser_chunk_splits(size):
+    chunks = [BODY[i:i + size] for i in range(0, len(BODY), size)]
+    assert parse(chunks) == MEMES
+
+
+def test_parser_yields_before_the_end():
+    parser = MemeParser()
+    half = BODY.index(b"}", BODY.index(b'"memes"')) + 1
+    assert parser.feed(BODY[:half]) == MEMES[:1]
+
+
+def test_parser_empty_catalog():
+    assert parse([b'{"success": true, "data": {"memes": []}}']) == []
+
+
+def test_parser_error_body():
+    with pytest.raises(ImgflipError, match="nope"):
+        parse([b'{"success": false, ', b'"error_message": "nope"}'])
+
+
+@pytest.mark.parametrize("body", [
+    b"[1, 2]",
+    b"<html>502 Bad Gateway</html>",
+    b"",
+    BODY[:len(BODY) // 2],
+])
+def test_parser_unexpected_body(body):
+    with pytest.raises(ValueError):
+        parse([body])
+
+
+def test_template_equality():
+    assert Template(**MEMES[0]) == Template(**MEMES[0])
+    assert Template(**MEMES[0]) != Template(**MEMES[1])
+    assert len({Template(**MEMES[0]), Template(**MEMES[0])}) == 1
+
+
+def test_template_views():
+    templates = TemplateList(MEMES)
+    assert templates == [Template(**meme) for meme in MEMES]
+    assert templates == TemplateList(MEMES)
+    assert templates[1:3] == [Template(**meme) for meme in MEMES[1:3]]
+    assert templates[0] is templates[0]
+    assert isinstance(templates.copy(), list)
+
+    by_name = TemplateDict(MEMES)
+    assert by_name == {meme["name"]: Template(**meme) for meme in MEMES}
+    assert list(by_name) == [meme["name"] for meme in MEMES]
+    assert by_name[MEMES[2]["name"]].id == 2
+    assert isinstance(by_name.copy(), dict)